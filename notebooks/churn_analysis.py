@@ -41,6 +41,19 @@ plt.rcParams['font.size'] = 10
 DATA_PATH = r"C:\Projects\Data Analyst Projects\customer-churn-analysis\data\WA_Fn-UseC_-Telco-Customer-Churn.csv"
 RANDOM_SEED = 42
 
+# Column dtypes declared at read time (text columns are low-cardinality categoricals)
+CATEGORICAL_COLUMNS = ['gender', 'Partner', 'Dependents', 'PhoneService', 'MultipleLines',
+                       'InternetService', 'OnlineSecurity', 'OnlineBackup', 'DeviceProtection',
+                       'TechSupport', 'StreamingTV', 'StreamingMovies', 'Contract',
+                       'PaperlessBilling', 'PaymentMethod', 'Churn']
+CSV_DTYPES = {
+    'SeniorCitizen': 'int8',
+    'tenure': 'int16',
+    'MonthlyCharges': 'float64',
+    'TotalCharges': 'float64',
+    **{col: 'category' for col in CATEGORICAL_COLUMNS}
+}
+
 print("=" * 70)
 print("CUSTOMER CHURN ANALYSIS - TELECOM INDUSTRY")
 print("Senior Data Analyst Portfolio Project")
@@ -55,26 +68,28 @@ print("-" * 50)
 def load_and_prepare_data(filepath):
     """Load and prepare the Telco Customer Churn dataset."""
     try:
-        df = pd.read_csv(filepath)
+        # TotalCharges is blank (a single space) for new customers
+        df = pd.read_csv(filepath, dtype=CSV_DTYPES, na_values={'TotalCharges': [' ']})
         print(f"✅ Data loaded successfully: {len(df):,} customers")
         
         # Data cleaning
-        # Convert TotalCharges to numeric (some rows have spaces)
-        df['TotalCharges'] = pd.to_numeric(df['TotalCharges'], errors='coerce')
-        
         # Fill missing TotalCharges with 0 (new customers)
-        df['TotalCharges'].fillna(0, inplace=True)
+        df['TotalCharges'] = df['TotalCharges'].fillna(0.0)
         
         # Convert SeniorCitizen to categorical
-        df['SeniorCitizen'] = df['SeniorCitizen'].map({0: 'No', 1: 'Yes'})
+        df['SeniorCitizen'] = pd.Categorical.from_codes(df['SeniorCitizen'].to_numpy(),
+                                                        categories=['No', 'Yes'])
         
         # Create binary churn indicator
-        df['Churned'] = (df['Churn'] == 'Yes').astype(int)
+        df['Churned'] = (df['Churn'] == 'Yes').astype('int8')
         
-        # Create tenure groups
-        df['TenureGroup'] = pd.cut(df['tenure'], 
-                                    bins=[0, 12, 24, 48, 72],
-                                    labels=['0-12 months', '13-24 months', '25-48 months', '49-72 months'])
+        # Create tenure groups: (0, 12], (12, 24], (24, 48], (48, 72] months
+        tenure = df['tenure'].to_numpy()
+        tenure_codes = np.searchsorted(np.array([12, 24, 48, 72]), tenure, side='left')
+        tenure_codes[(tenure <= 0) | (tenure > 72)] = -1  # Outside the bins -> missing
+        df['TenureGroup'] = pd.Categorical.from_codes(tenure_codes,
+                                                      categories=['0-12 months', '13-24 months', '25-48 months', '49-72 months'],
+                                                      ordered=True)
         
         # Calculate monthly revenue at risk
         df['RevenueAtRisk'] = df['MonthlyCharges'] * df['Churned']
@@ -83,10 +98,8 @@ def load_and_prepare_data(filepath):
         service_cols = ['PhoneService', 'MultipleLines', 'InternetService', 
                        'OnlineSecurity', 'OnlineBackup', 'DeviceProtection',
                        'TechSupport', 'StreamingTV', 'StreamingMovies']
-        df['ServiceCount'] = df[service_cols].apply(
-            lambda x: sum(1 for val in x if val not in ['No', 'No phone service', 'No internet service']), 
-            axis=1
-        )
+        no_service = ['No', 'No phone service', 'No internet service']
+        df['ServiceCount'] = (~df[service_cols].isin(no_service)).to_numpy().sum(axis=1, dtype=np.int8)
         
         print(f"✅ Data prepared: {df.shape[0]:,} rows, {df.shape[1]} columns")
         return df
@@ -116,17 +129,33 @@ print("\n📈 SECTION 2: CHURN RATE ANALYSIS BY SEGMENTS")
 print("-" * 50)
 
 def analyze_churn_by_segment(df, column, column_label=None):
-    """Analyze churn rate by a categorical segment."""
+    """
+    Analyze churn rate by a categorical segment.
+    Aggregates are counted straight off the category codes with np.bincount.
+    """
     if column_label is None:
         column_label = column
     
-    analysis = df.groupby(column).agg({
-        'customerID': 'count',
-        'Churned': ['sum', 'mean'],
-        'MonthlyCharges': 'sum'
-    }).round(4)
+    segment = df[column]
+    categories = segment.cat.categories
+    codes = segment.cat.codes.to_numpy()
+    
+    # Missing values have code -1 and are excluded, as in a groupby
+    valid = codes >= 0
+    codes = codes[valid]
+    total = np.bincount(codes, minlength=len(categories))
+    churned = np.bincount(codes, weights=df['Churned'].to_numpy()[valid], minlength=len(categories))
+    revenue = np.bincount(codes, weights=df['MonthlyCharges'].to_numpy()[valid], minlength=len(categories))
+    
+    # Keep observed segments only
+    observed = total > 0
+    analysis = pd.DataFrame({
+        'Total Customers': total[observed],
+        'Churned': churned[observed].astype(np.int64),
+        'Churn Rate': churned[observed] / total[observed],
+        'Total Revenue': revenue[observed]
+    }, index=pd.Index(categories[observed], name=column)).round(4)
     
-    analysis.columns = ['Total Customers', 'Churned', 'Churn Rate', 'Total Revenue']
     analysis['Churn Rate %'] = (analysis['Churn Rate'] * 100).round(1)
     analysis['Revenue at Risk'] = (analysis['Total Revenue'] * analysis['Churn Rate']).round(2)
     
@@ -161,9 +190,33 @@ if df is not None:
 print("\n🧪 SECTION 3: STATISTICAL SIGNIFICANCE TESTING")
 print("-" * 50)
 
-def chi_square_test(df, column1, column2='Churn'):
-    """Perform chi-square test for independence between two categorical variables."""
-    contingency = pd.crosstab(df[column1], df[column2])
+def contingency_tables(df, columns, target='Churn'):
+    """
+    Build the contingency table of each categorical column against the target.
+    The category codes of all columns are stacked with per-column offsets so
+    every table comes out of a single np.bincount pass.
+    """
+    n_levels = np.array([len(df[col].cat.categories) for col in columns])
+    offsets = np.concatenate([[0], np.cumsum(n_levels)[:-1]])
+    raw_codes = np.column_stack([df[col].cat.codes.to_numpy() for col in columns])
+    
+    target_codes = df[target].cat.codes.to_numpy()
+    n_target = len(df[target].cat.categories)
+    n_cells = n_levels.sum() * n_target
+    
+    # Missing values (code -1) go to a dump bin past the last cell, as crosstab drops them
+    valid = (raw_codes >= 0) & (target_codes >= 0)[:, None]
+    cells = np.where(valid, (raw_codes + offsets) * n_target + target_codes[:, None], n_cells)
+    counts = np.bincount(cells.ravel(), minlength=n_cells + 1)[:n_cells].reshape(-1, n_target)
+    
+    tables = {}
+    for col, start, n in zip(columns, offsets, n_levels):
+        table = counts[start:start + n]
+        tables[col] = table[table.sum(axis=1) > 0]  # Drop unobserved levels
+    return tables
+
+def chi_square_test(contingency):
+    """Perform chi-square test for independence on a contingency table."""
     chi2, p_value, dof, expected = chi2_contingency(contingency)
     
     return chi2, p_value, dof
@@ -175,9 +228,10 @@ if df is not None:
     test_columns = ['Contract', 'PaymentMethod', 'TechSupport', 'InternetService', 
                     'SeniorCitizen', 'Partner', 'Dependents']
     
+    tables = contingency_tables(df, test_columns)
     results = []
     for col in test_columns:
-        chi2, p_value, dof = chi_square_test(df, col)
+        chi2, p_value, dof = chi_square_test(tables[col])
         significance = "✅ Significant" if p_value < 0.05 else "❌ Not Significant"
         results.append({
             'Factor': col,
@@ -199,14 +253,14 @@ def calculate_clv(df, projection_months=36):
     """
     Calculate Customer Lifetime Value.
     CLV = TotalCharges + (MonthlyCharges × Projected Remaining Months)
+    Columns are added to df in place (no frame copy).
     """
-    df = df.copy()
-    
     # Projected CLV (3-year horizon)
-    df['ProjectedCLV'] = df['TotalCharges'] + (df['MonthlyCharges'] * projection_months)
+    clv = df['TotalCharges'].to_numpy() + df['MonthlyCharges'].to_numpy() * projection_months
+    df['ProjectedCLV'] = clv
     
     # CLV at Risk (for churned/high-risk customers)
-    df['CLVAtRisk'] = df['ProjectedCLV'] * df['Churned']
+    df['CLVAtRisk'] = clv * df['Churned'].to_numpy()
     
     return df
 
@@ -227,7 +281,7 @@ if df is not None:
     
     # CLV by Contract Type
     print(f"\n📊 Average CLV by Contract Type:")
-    clv_by_contract = df.groupby('Contract')['ProjectedCLV'].mean().round(2)
+    clv_by_contract = df.groupby('Contract', observed=True)['ProjectedCLV'].mean().round(2)
     for contract, clv in clv_by_contract.items():
         print(f"   {contract}: ${clv:,.2f}")
 
@@ -237,9 +291,9 @@ if df is not None:
 print("\n⚠️ SECTION 5: RISK SCORING MODEL")
 print("-" * 50)
 
-def calculate_risk_score(row):
+def calculate_risk_score(df):
     """
-    Calculate churn risk score based on key risk factors.
+    Calculate churn risk scores based on key risk factors.
     Higher score = Higher churn risk.
     
     Scoring weights based on observed churn ratios:
@@ -250,63 +304,54 @@ def calculate_risk_score(row):
     - No online security: 2 points
     - Monthly charges > $80: 2 points (price sensitivity)
     - Fiber optic internet: 1 point (higher churn than DSL)
+    
+    Each rule is evaluated as a boolean column over the whole frame,
+    so scores for all customers are computed in a single pass.
     """
-    score = 0
+    has_internet = df['InternetService'].ne('No')
     
     # Contract type (highest impact)
-    if row['Contract'] == 'Month-to-month':
-        score += 3
-    elif row['Contract'] == 'One year':
-        score += 1
+    score = df['Contract'].eq('Month-to-month').astype('int8') * 3
+    score += df['Contract'].eq('One year').astype('int8') * 1
     
     # Tenure (early churn is common)
-    if row['tenure'] <= 12:
-        score += 3
-    elif row['tenure'] <= 24:
-        score += 1
+    score += df['tenure'].le(12).astype('int8') * 3
+    score += (df['tenure'].gt(12) & df['tenure'].le(24)).astype('int8') * 1
     
     # Payment method (friction indicator)
-    if row['PaymentMethod'] == 'Electronic check':
-        score += 2
+    score += df['PaymentMethod'].eq('Electronic check').astype('int8') * 2
     
     # Tech support (value-add services)
-    if row['TechSupport'] == 'No' and row['InternetService'] != 'No':
-        score += 2
+    score += (df['TechSupport'].eq('No') & has_internet).astype('int8') * 2
     
     # Online security
-    if row['OnlineSecurity'] == 'No' and row['InternetService'] != 'No':
-        score += 2
+    score += (df['OnlineSecurity'].eq('No') & has_internet).astype('int8') * 2
     
     # Price sensitivity
-    if row['MonthlyCharges'] > 80:
-        score += 2
+    score += df['MonthlyCharges'].gt(80).astype('int8') * 2
     
     # Internet type
-    if row['InternetService'] == 'Fiber optic':
-        score += 1
+    score += df['InternetService'].eq('Fiber optic').astype('int8') * 1
     
     return score
 
-def assign_risk_category(score):
-    """Assign risk category based on score."""
-    if score >= 10:
-        return 'Critical Risk'
-    elif score >= 7:
-        return 'High Risk'
-    elif score >= 4:
-        return 'Medium Risk'
-    else:
-        return 'Low Risk'
+def assign_risk_category(scores):
+    """Assign risk categories based on scores (0-3 Low, 4-6 Medium, 7-9 High, 10+ Critical)."""
+    return pd.cut(scores,
+                  bins=[-np.inf, 4, 7, 10, np.inf],
+                  labels=['Low Risk', 'Medium Risk', 'High Risk', 'Critical Risk'],
+                  right=False)
 
 if df is not None:
-    # Calculate risk scores for active customers only
-    active_customers = df[df['Churned'] == 0].copy()
-    active_customers['RiskScore'] = active_customers.apply(calculate_risk_score, axis=1)
-    active_customers['RiskCategory'] = active_customers['RiskScore'].apply(assign_risk_category)
+    # Score every customer once, then report on active customers only
+    df['RiskScore'] = calculate_risk_score(df)
+    df['RiskCategory'] = assign_risk_category(df['RiskScore'])
+    active_mask = df['Churned'].to_numpy() == 0
+    active_customers = df.loc[active_mask]
     
     # Risk distribution
     print(f"\n📊 Risk Score Distribution (Active Customers Only):")
-    risk_summary = active_customers.groupby('RiskCategory').agg({
+    risk_summary = active_customers.groupby('RiskCategory', observed=True, sort=False).agg({
         'customerID': 'count',
         'MonthlyCharges': 'sum',
         'RiskScore': 'mean'
@@ -331,11 +376,9 @@ if df is not None:
     
     # Validate risk model against actual churn
     print(f"\n📊 Risk Model Validation (Against Churned Customers):")
-    churned_customers = df[df['Churned'] == 1].copy()
-    churned_customers['RiskScore'] = churned_customers.apply(calculate_risk_score, axis=1)
-    churned_customers['RiskCategory'] = churned_customers['RiskScore'].apply(assign_risk_category)
+    churned_customers = df.loc[~active_mask]
     
-    churned_risk = churned_customers.groupby('RiskCategory').size()
+    churned_risk = churned_customers.groupby('RiskCategory', observed=True, sort=False).size()
     churned_risk_pct = (churned_risk / len(churned_customers) * 100).round(1)
     
     for category in risk_order:
@@ -348,8 +391,12 @@ if df is not None:
 print("\n📊 SECTION 6: CREATING VISUALIZATIONS")
 print("-" * 50)
 
-def create_visualizations(df, active_customers):
-    """Create comprehensive churn analysis visualizations."""
+def create_visualizations(segments, risk_counts, churned_charges, retained_charges):
+    """
+    Create comprehensive churn analysis visualizations.
+    Plots are drawn from the Section 2 segment analyses, the Section 5 risk
+    counts and pre-extracted MonthlyCharges arrays; nothing is regrouped here.
+    """
     
     fig, axes = plt.subplots(2, 3, figsize=(18, 12))
     fig.suptitle('Customer Churn Analysis - Telecom Industry', fontsize=16, fontweight='bold', y=1.02)
@@ -359,7 +406,8 @@ def create_visualizations(df, active_customers):
     
     # 1. Churn by Contract Type
     ax1 = axes[0, 0]
-    contract_churn = df.groupby('Contract')['Churned'].mean() * 100
+    contract = segments['Contract']
+    contract_churn = contract['Churned'] / contract['Total Customers'] * 100
     contract_order = ['Month-to-month', 'One year', 'Two year']
     contract_churn = contract_churn.reindex(contract_order)
     
@@ -375,7 +423,8 @@ def create_visualizations(df, active_customers):
     
     # 2. Churn by Tenure Group
     ax2 = axes[0, 1]
-    tenure_churn = df.groupby('TenureGroup')['Churned'].mean() * 100
+    tenure = segments['TenureGroup']
+    tenure_churn = tenure['Churned'] / tenure['Total Customers'] * 100
     
     bars = ax2.bar(range(len(tenure_churn)), tenure_churn.values,
                    color=plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, len(tenure_churn))),
@@ -392,7 +441,8 @@ def create_visualizations(df, active_customers):
     
     # 3. Churn by Payment Method
     ax3 = axes[0, 2]
-    payment_churn = df.groupby('PaymentMethod')['Churned'].mean() * 100
+    payment = segments['PaymentMethod']
+    payment_churn = payment['Churned'] / payment['Total Customers'] * 100
     payment_churn = payment_churn.sort_values(ascending=True)
     
     colors_payment = plt.cm.RdYlGn(np.linspace(0.2, 0.8, len(payment_churn)))[::-1]
@@ -407,9 +457,9 @@ def create_visualizations(df, active_customers):
     
     # 4. Tech Support Impact
     ax4 = axes[1, 0]
-    # Filter for internet customers only
-    internet_customers = df[df['InternetService'] != 'No']
-    tech_churn = internet_customers.groupby('TechSupport')['Churned'].mean() * 100
+    # 'No'/'Yes' only occur for internet customers ('No internet service' otherwise)
+    tech = segments['TechSupport']
+    tech_churn = tech['Churned'] / tech['Total Customers'] * 100
     
     bars = ax4.bar(['No Tech Support', 'Has Tech Support'], 
                    [tech_churn.get('No', 0), tech_churn.get('Yes', 0)],
@@ -424,10 +474,6 @@ def create_visualizations(df, active_customers):
     
     # 5. Risk Score Distribution
     ax5 = axes[1, 1]
-    risk_counts = active_customers['RiskCategory'].value_counts()
-    risk_order = ['Critical Risk', 'High Risk', 'Medium Risk', 'Low Risk']
-    risk_counts = risk_counts.reindex([r for r in risk_order if r in risk_counts.index])
-    
     colors_risk = ['#c0392b', '#e74c3c', '#f39c12', '#27ae60'][:len(risk_counts)]
     wedges, texts, autotexts = ax5.pie(risk_counts.values, labels=risk_counts.index,
                                         autopct='%1.1f%%', colors=colors_risk,
@@ -436,11 +482,13 @@ def create_visualizations(df, active_customers):
     
     # 6. Monthly Charges Distribution
     ax6 = axes[1, 2]
-    churned_charges = df[df['Churned'] == 1]['MonthlyCharges']
-    retained_charges = df[df['Churned'] == 0]['MonthlyCharges']
-    
-    ax6.hist(retained_charges, bins=30, alpha=0.6, label='Retained', color='#27ae60', density=True)
-    ax6.hist(churned_charges, bins=30, alpha=0.6, label='Churned', color='#e74c3c', density=True)
+    # Bin both groups on shared edges with NumPy and draw the precomputed densities
+    edges = np.linspace(min(retained_charges.min(), churned_charges.min()),
+                        max(retained_charges.max(), churned_charges.max()), 31)
+    retained_density, _ = np.histogram(retained_charges, bins=edges, density=True)
+    churned_density, _ = np.histogram(churned_charges, bins=edges, density=True)
+    ax6.stairs(retained_density, edges, fill=True, alpha=0.6, label='Retained', color='#27ae60')
+    ax6.stairs(churned_density, edges, fill=True, alpha=0.6, label='Churned', color='#e74c3c')
     ax6.axvline(retained_charges.mean(), color='#1d8348', linestyle='--', linewidth=2,
                 label=f'Retained Mean: ${retained_charges.mean():.0f}')
     ax6.axvline(churned_charges.mean(), color='#922b21', linestyle='--', linewidth=2,
@@ -460,7 +508,15 @@ def create_visualizations(df, active_customers):
 # Create visualizations
 if df is not None:
     try:
-        create_visualizations(df, active_customers)
+        segments = {
+            'Contract': contract_analysis,
+            'TenureGroup': tenure_analysis,
+            'PaymentMethod': payment_analysis,
+            'TechSupport': tech_analysis
+        }
+        create_visualizations(segments, risk_summary['Customers'],
+                              df.loc[~active_mask, 'MonthlyCharges'].to_numpy(),
+                              df.loc[active_mask, 'MonthlyCharges'].to_numpy())
     except Exception as e:
         print(f"⚠️  Could not create visualization: {e}")
         print("   Run in Jupyter notebook for interactive plots.")
@@ -472,11 +528,17 @@ print("\n💼 SECTION 7: BUSINESS IMPACT & RECOMMENDATIONS")
 print("-" * 50)
 
 if df is not None:
+    # Cache the arrays reused below; every figure in this section is derived
+    # from NumPy boolean masks rather than filtered sub-DataFrames
+    charges = df['MonthlyCharges'].to_numpy()
+    churned_mask = df['Churned'].to_numpy(dtype=bool)
+    retained_mask = ~churned_mask
+    
     # Current state
     total_customers = len(df)
-    churned_count = df['Churned'].sum()
-    churn_rate = df['Churned'].mean()
-    monthly_revenue_loss = df[df['Churned'] == 1]['MonthlyCharges'].sum()
+    churned_count = int(churned_mask.sum())
+    churn_rate = churned_mask.mean()
+    monthly_revenue_loss = charges[churned_mask].sum()
     annual_revenue_loss = monthly_revenue_loss * 12
     
     print(f"\n📊 Current State:")
@@ -490,15 +552,17 @@ if df is not None:
     print(f"\n💡 Intervention Impact Projections:")
     
     # Intervention 1: Contract Migration
-    monthly_customers = len(df[df['Contract'] == 'Month-to-month'])
-    monthly_churn = df[df['Contract'] == 'Month-to-month']['Churned'].mean()
-    annual_churn = df[df['Contract'] == 'One year']['Churned'].mean()
+    monthly_mask = df['Contract'].eq('Month-to-month').to_numpy()
+    annual_mask = df['Contract'].eq('One year').to_numpy()
+    monthly_customers = int(monthly_mask.sum())
+    monthly_churn = churned_mask[monthly_mask].mean()
+    annual_churn = churned_mask[annual_mask].mean()
     
     conversion_rate = 0.30  # 30% convert to annual
     converted_customers = int(monthly_customers * conversion_rate)
     churn_reduction = monthly_churn - annual_churn
     customers_saved = int(converted_customers * churn_reduction)
-    avg_monthly_charge = df['MonthlyCharges'].mean()
+    avg_monthly_charge = charges.mean()
     revenue_saved_contract = customers_saved * avg_monthly_charge * 12
     
     print(f"\n   1️⃣ Contract Migration (Monthly → Annual):")
@@ -509,9 +573,11 @@ if df is not None:
     print(f"      Annual revenue protected: ${revenue_saved_contract:,.2f}")
     
     # Intervention 2: Payment Method Migration
-    echeck_customers = len(df[(df['PaymentMethod'] == 'Electronic check') & (df['Churned'] == 0)])
-    echeck_churn = df[df['PaymentMethod'] == 'Electronic check']['Churned'].mean()
-    cc_churn = df[df['PaymentMethod'].str.contains('credit card', case=False)]['Churned'].mean()
+    echeck_mask = df['PaymentMethod'].eq('Electronic check').to_numpy()
+    cc_mask = df['PaymentMethod'].eq('Credit card (automatic)').to_numpy()
+    echeck_customers = int((echeck_mask & retained_mask).sum())
+    echeck_churn = churned_mask[echeck_mask].mean()
+    cc_churn = churned_mask[cc_mask].mean()
     
     migration_rate = 0.40
     migrated_customers = int(echeck_customers * migration_rate)
@@ -527,9 +593,11 @@ if df is not None:
     print(f"      Annual revenue protected: ${revenue_saved_payment:,.2f}")
     
     # Intervention 3: Tech Support Bundling
-    no_tech = len(df[(df['TechSupport'] == 'No') & (df['InternetService'] != 'No') & (df['Churned'] == 0)])
-    no_tech_churn = df[(df['TechSupport'] == 'No') & (df['InternetService'] != 'No')]['Churned'].mean()
-    with_tech_churn = df[df['TechSupport'] == 'Yes']['Churned'].mean()
+    no_tech_mask = df['TechSupport'].eq('No').to_numpy() & df['InternetService'].ne('No').to_numpy()
+    with_tech_mask = df['TechSupport'].eq('Yes').to_numpy()
+    no_tech = int((no_tech_mask & retained_mask).sum())
+    no_tech_churn = churned_mask[no_tech_mask].mean()
+    with_tech_churn = churned_mask[with_tech_mask].mean()
     
     tech_cost_per_customer = 8 * 12  # $8/month
     customers_saved_tech = int(no_tech * (no_tech_churn - with_tech_churn))
@@ -613,6 +681,7 @@ print(summary)
 print("\n📁 SECTION 9: EXPORT RESULTS")
 print("-" * 50)
 
+parquet_exported = False
 if df is not None:
     try:
         # Export high-risk customers for intervention
@@ -625,6 +694,15 @@ if df is not None:
         print(f"✅ High-risk customer list exported: {len(high_risk_export):,} customers")
         print("   File: ../insights/high_risk_customers.csv")
         
+        # Typed columnar copy for re-reading (keeps categorical/int8 dtypes; needs pyarrow)
+        try:
+            high_risk_export.to_parquet(r'C:\Projects\Data Analyst Projects\customer-churn-analysis\insights\high_risk_customers.parquet',
+                                        index=False, compression='snappy')
+            parquet_exported = True
+            print("   File: ../insights/high_risk_customers.parquet")
+        except ImportError:
+            print("   ⚠️  Parquet export skipped (install pyarrow)")
+        
         # Export summary metrics
         summary_metrics = pd.DataFrame({
             'Metric': [
@@ -663,4 +741,6 @@ print("   Expected ROI: 6.7x ($1.2M annual savings)")
 print("\n📊 Files generated:")
 print("   • ../insights/churn_analysis_dashboard.png")
 print("   • ../insights/high_risk_customers.csv")
+if parquet_exported:
+    print("   • ../insights/high_risk_customers.parquet")
 print("   • ../insights/churn_summary_metrics.csv")